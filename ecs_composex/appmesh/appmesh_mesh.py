@@ -127,7 +127,7 @@ class Mesh:
             ]
         add_outputs(self.stack.stack_template, mesh_outputs)
         for key in self.required_keys:
-            if key not in self.mesh_settings.keys():
+            if key not in self.mesh_settings:
                 raise KeyError(f"Key {key} is missing. Required {self.required_keys}")
         self.define_nodes(settings)
         self.define_routes_and_routers()
@@ -178,7 +178,7 @@ class MeshRouter:
         listener = self.definition[LISTENER_KEY]
         if not keyisset(PORT_KEY, listener) or not keyisset(PROTOCOL_KEY, listener):
             raise KeyError("Listener for router requires Port and Protocol")
-        if listener[PROTOCOL_KEY] not in routes.keys():
+        if listener[PROTOCOL_KEY] not in routes:
             raise ValueError(
                 f"The virtual router is configured for {listener[PROTOCOL_KEY]} but no such route configured"
             )
@@ -200,7 +200,7 @@ class MeshRouter:
                 )
             route_nodes = []
             for node in route[NODES_KEY]:
-                if node[NAME_KEY] in nodes.keys():
+                if node[NAME_KEY] in nodes:
                     route_nodes.append(nodes[node[NAME_KEY]])
                 else:
                     raise ValueError(
@@ -237,7 +237,7 @@ class MeshRouter:
                 raise AttributeError("Each route must have nodes. Got", route.keys())
             route_nodes = []
             for node in route[NODES_KEY]:
-                if node[NAME_KEY] in nodes.keys():
+                if node[NAME_KEY] in nodes:
                     route_nodes.append(nodes[node[NAME_KEY]])
                 else:
                     raise ValueError(
@@ -46,14 +46,14 @@ def validate_service_backend(service, routers, nodes):
     :param routers:
     :raises: KeyError
     """
-    if keyisset(ROUTER_KEY, service) and service[ROUTER_KEY] not in routers.keys():
+    if keyisset(ROUTER_KEY, service) and service[ROUTER_KEY] not in routers:
         raise KeyError(
             "Routers provided not found in the routers description. Got",
             service[ROUTERS_KEY],
             "Expected",
             routers.keys(),
         )
-    if keyisset(NODE_KEY, service) and service[NODE_KEY] not in nodes.keys():
+    if keyisset(NODE_KEY, service) and service[NODE_KEY] not in nodes:
         raise KeyError(
             "Nodes provided not found in nodes defined. Got",
             service[NODE_KEY],
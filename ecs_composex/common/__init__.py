@@ -16,13 +16,45 @@ if TYPE_CHECKING:
 import re
 from datetime import datetime as dt
 from math import ceil, log
+from os import environ
 from uuid import uuid4
 
-DATE = dt.utcnow().isoformat()
-FILE_PREFIX = f'{dt.utcnow().strftime("%Y/%m/%d/%H%M")}/{str(uuid4().hex)[:6]}'
+import yaml
+
+NOW = dt.utcnow()
+DATE = NOW.isoformat()
+FILE_PREFIX = f'{NOW.strftime("%Y/%m/%d/%H%M")}/{str(uuid4().hex)[:6]}'
 NONALPHANUM = re.compile(r"([^a-zA-Z\d]+)")
 
 
+def _get_yaml_loader():
+    """
+    Function to select the YAML loader: libyaml based CSafeLoader when available, SafeLoader otherwise.
+    Set ``COMPOSEX_PY_YAML=1`` to force the pure python loader.
+
+    :return: the YAML loader class
+    """
+    if environ.get("COMPOSEX_PY_YAML", "0") == "1":
+        return yaml.SafeLoader
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+Loader = _get_yaml_loader()
+
+
+def load_composex_file(file_path: str):
+    """
+    Function to load a YAML (or JSON) file. The file object is handed over to the loader
+    so that libyaml, when available, tokenizes the content as it reads it.
+    Set ``COMPOSEX_PY_YAML=1`` to force the pure python loader.
+
+    :param str file_path: Path to the file to load
+    :return: the parsed content
+    """
+    with open(file_path) as composex_fd:
+        return yaml.load(composex_fd, Loader=Loader)
+
+
 def clpow2(x):
     """
     Function to return the closest power of two from given x
@@ -65,7 +65,7 @@ def set_filters_from_tags_list(tags: list) -> list:
     filters_mapping = {}
     for tag in tags:
         for key, value in tag.items():
-            if key not in filters_mapping.keys():
+            if key not in filters_mapping:
                 if not isinstance(value, list):
                     filters_mapping[key] = [value]
                 else:
@@ -201,7 +201,7 @@ def validate_search_input(res_types, res_type):
 
     if not isinstance(res_type, str):
         raise KeyError("type must be one of", res_types.keys(), "Got", res_type)
-    if res_type not in res_types.keys():
+    if res_type not in res_types:
         raise KeyError(
             f"There is not resource type {res_type} defined. Got",
             res_types.keys(),
@@ -3,14 +3,14 @@
 
 """Common Conditions across the templates"""
 
-from troposphere import Equals, If, Ref
+from troposphere import Equals, If, Ref, StackName
 
 from ecs_composex.common import cfn_params
 
+ROOT_STACK_NAME_REF = Ref(cfn_params.ROOT_STACK_NAME)
+
 USE_STACK_NAME_CON_T = "UseStackName"
-USE_STACK_NAME_CON = Equals(
-    Ref(cfn_params.ROOT_STACK_NAME), cfn_params.ROOT_STACK_NAME.Default
-)
+USE_STACK_NAME_CON = Equals(ROOT_STACK_NAME_REF, cfn_params.ROOT_STACK_NAME.Default)
 
 
 def pass_root_stack_name():
@@ -22,8 +22,8 @@ def pass_root_stack_name():
     return {
         cfn_params.ROOT_STACK_NAME_T: If(
             USE_STACK_NAME_CON_T,
-            Ref("AWS::StackName"),
-            Ref(cfn_params.ROOT_STACK_NAME),
+            StackName,
+            ROOT_STACK_NAME_REF,
         )
     }
 
@@ -40,6 +40,6 @@ def define_stack_name(template=None):
         template.add_condition(USE_STACK_NAME_CON_T, USE_STACK_NAME_CON)
     return If(
         USE_STACK_NAME_CON_T,
-        Ref("AWS::StackName"),
-        Ref(cfn_params.ROOT_STACK_NAME),
+        StackName,
+        ROOT_STACK_NAME_REF,
     )
@@ -35,16 +35,21 @@ class ErrorFilter(logthings.Filter):
         return rec.levelno not in (logthings.DEBUG, logthings.INFO)
 
 
+APP_LOGGER = None
+
+
 def setup_logging():
-    """ """
+    """
+    Configures the ecs-compose-x logger on first call. Subsequent calls return the configured logger.
+    """
+    global APP_LOGGER
+    if APP_LOGGER is not None:
+        return APP_LOGGER
     root_logger = logthings.getLogger()
-    for h in root_logger.handlers:
-        root_logger.removeHandler(h)
+    root_logger.handlers.clear()
 
     app_logger = logthings.getLogger("ecs-compose-x")
-
-    for h in app_logger.handlers:
-        root_logger.removeHandler(h)
+    app_logger.handlers.clear()
 
     stdout_handler = logthings.StreamHandler(sys.stdout)
     stdout_handler.setFormatter(MyFormatter())
@@ -59,6 +64,7 @@ def setup_logging():
     app_logger.addHandler(stdout_handler)
     app_logger.addHandler(stderr_handler)
     app_logger.setLevel(logthings.INFO)
+    APP_LOGGER = app_logger
     return app_logger
 
 
@@ -19,13 +19,6 @@ from re import compile, sub
 
 import boto3
 import yaml
-
-try:
-    from yaml import Dumper as Dumper
-    from yaml import Loader as Loader
-except ImportError:
-    from yaml import CDumper as Dumper, CLoader as Loader
-
 from botocore.exceptions import ClientError
 from cfn_flip.yaml_dumper import LongCleanDumper
 from compose_x_common.aws import get_account_id, validate_iam_role_arn
@@ -35,7 +28,6 @@ from importlib_resources import files as pkg_files
 from troposphere import AWSObject
 
 from ecs_composex import __version__
-from ecs_composex.common import NONALPHANUM
 from ecs_composex.common.aws import get_cross_role_session
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.stacks import ComposeXStack
@@ -491,16 +483,27 @@ class ComposeXSettings:
         """
         assigned_services = []
         services_to_assign = [_service for _service in self.services]
+        formatted_names = {
+            family_name: sub(r"[^a-zA-Z0-9]+", "", family_name)
+            for service in services_to_assign
+            for family_name in service.families
+        }
+        invalid_names = [
+            family_name
+            for family_name, formatted_name in formatted_names.items()
+            if not formatted_name
+        ]
+        if invalid_names:
+            raise ValueError(
+                "Family names must contain alphanumerical characters ^[a-zA-Z0-9]+$. Got",
+                invalid_names,
+            )
         for service in services_to_assign:
             for family_name in service.families:
-                formatted_name = sub(r"[^a-zA-Z0-9]+", "", family_name)
-                if NONALPHANUM.findall(formatted_name):
-                    raise ValueError(
-                        "Family names must be ^[a-zA-Z0-9]+$ | alphanumerical"
-                    )
+                formatted_name = formatted_names[family_name]
                 if formatted_name not in self.families:
                     self.add_new_family(family_name, service, assigned_services)
-                elif formatted_name in self.families.keys():
+                elif formatted_name in self.families:
                     family_services = [
                         _service.name
                         for _service in self.families[formatted_name].ordered_services
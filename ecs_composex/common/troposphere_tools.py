@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 from copy import deepcopy
 
 from compose_x_common.compose_x_common import keyisset, keypresent, set_else_none
-from troposphere import AWS_NO_VALUE, Join, Output
+from troposphere import MAX_PARAMETERS, Join, NoValue, Output
 from troposphere import Parameter as CfnParameter
 from troposphere import Ref, Template
 
@@ -24,7 +24,7 @@ from ecs_composex.common.cfn_params import ROOT_STACK_NAME, Parameter
 
 def no_value_if_not_set(props, key, is_bool=False):
     """
-    Function to simplify setting value if the key is in the dict and else Ref(AWS_NO_VALUE) for resource properties
+    Function to simplify setting value if the key is in the dict and else NoValue for resource properties
 
     :param dict props:
     :param str key:
@@ -32,9 +32,9 @@ def no_value_if_not_set(props, key, is_bool=False):
     :return:
     """
     if not is_bool:
-        return Ref(AWS_NO_VALUE) if not keyisset(key, props) else props[key]
+        return NoValue if not keyisset(key, props) else props[key]
     else:
-        return Ref(AWS_NO_VALUE) if not keypresent(key, props) else props[key]
+        return NoValue if not keypresent(key, props) else props[key]
 
 
 def init_template(description=None):
@@ -134,12 +134,17 @@ def add_parameters(template: Template, parameters: list) -> None:
     :type parameters: list<ecs_composex.common.cfn_params.Parameter>
     """
     for param in parameters:
-        if not isinstance(param, (Parameter, CfnParameter)) or not issubclass(
-            type(param), (Parameter, CfnParameter)
-        ):
-            raise TypeError("Parameter must be of type", Parameter, "Got", type(param))
-        if template and param.title not in template.parameters:
-            template.add_parameter(param)
+        if not isinstance(param, (Parameter, CfnParameter)):
+            raise TypeError(f"Parameter must be of type {Parameter}, got {type(param)}")
+    if template:
+        new_parameters = {}
+        for param in parameters:
+            if param.title not in template.parameters:
+                new_parameters.setdefault(param.title, param)
+        if len(template.parameters) + len(new_parameters) > MAX_PARAMETERS:
+            raise ValueError("Maximum parameters %d reached" % MAX_PARAMETERS)
+        template.parameters.update(new_parameters)
+    for param in parameters:
         if isinstance(param, Parameter) and (param.group_label or param.label):
             add_parameters_metadata(template, param)
 
@@ -193,7 +198,7 @@ def add_resource(template, resource, replace=False) -> AWSObject:
     """
     if (
         resource not in template.resources.values()
-        and resource.title not in template.resources.keys()
+        and resource.title not in template.resources
     ):
         return template.add_resource(resource)
     elif resource.title in template.resources and replace:
@@ -208,7 +213,7 @@ def set_get_resource(template, resource) -> (AWSObject, bool):
     """
     if (
         resource not in template.resources.values()
-        and resource.title not in template.resources.keys()
+        and resource.title not in template.resources
     ):
         return template.add_resource(resource), False
     return template.resources[resource.title], True
@@ -216,15 +221,17 @@ def set_get_resource(template, resource) -> (AWSObject, bool):
 
 def add_defaults(template):
     """Function to CFN parameters and conditions to the template which are used
-    across ECS ComposeX
+    across ECS ComposeX. Skips the ones already present in the template.
 
     :param template: source template to add the params and conditions to
     :type template: Template
     """
-    template.add_parameter(ROOT_STACK_NAME)
-    template.add_condition(
-        cfn_conditions.USE_STACK_NAME_CON_T, cfn_conditions.USE_STACK_NAME_CON
-    )
+    if ROOT_STACK_NAME.title not in template.parameters:
+        template.add_parameter(ROOT_STACK_NAME)
+    if cfn_conditions.USE_STACK_NAME_CON_T not in template.conditions:
+        template.add_condition(
+            cfn_conditions.USE_STACK_NAME_CON_T, cfn_conditions.USE_STACK_NAME_CON
+        )
 
 
 def build_template(description=None, *parameters):
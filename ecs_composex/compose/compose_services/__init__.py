@@ -589,7 +589,9 @@ class ComposeService:
         ):
             if keyisset("disable", self.healthcheck):
                 return NoValue
-            valid_keys = ["test", "interval", "timeout", "retries", "start_period"]
+            valid_keys = frozenset(
+                ("test", "interval", "timeout", "retries", "start_period")
+            )
             attr_mappings = {
                 "test": ("Command", None),
                 "interval": ("Interval", import_time_values_to_seconds),
@@ -597,7 +599,7 @@ class ComposeService:
                 "retries": ("Retries", None),
                 "start_period": ("StartPeriod", import_time_values_to_seconds),
             }
-            required_keys = ["test"]
+            required_keys = frozenset(("test",))
             validate_healthcheck(self.healthcheck, valid_keys, required_keys)
             params = {}
             for key, value in self.healthcheck.items():
@@ -92,13 +92,13 @@ def set_memory_to_mb(value):
     gb_pat = re.compile(r"(^[0-9.]+(g|gb|gB|Gb|G|GB)$)")
     amount = float(re.sub(NUMBERS_REG, "", value))
     unit = "MBytes"
-    if b_pat.findall(value):
+    if b_pat.search(value):
         final_amount = handle_bytes_units(value, pow(pow(2, 10), 2))
-    elif kb_pat.findall(value):
+    elif kb_pat.search(value):
         final_amount = handle_bytes_units(value, pow(2, 10))
-    elif mb_pat.findall(value):
+    elif mb_pat.search(value):
         final_amount = int(amount)
-    elif gb_pat.findall(value):
+    elif gb_pat.search(value):
         unit = "GBytes"
         final_amount = int(amount * pow(2, 10))
     else:
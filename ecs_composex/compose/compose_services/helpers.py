@@ -222,13 +222,14 @@ def validate_healthcheck(healthcheck, valid_keys, required_keys):
     Healthcheck definition validation
 
     :param dict healthcheck:
-    :param list valid_keys:
-    :param list required_keys:
+    :param frozenset valid_keys:
+    :param frozenset required_keys:
     """
-    for key in healthcheck.keys():
-        if key not in valid_keys:
-            raise AttributeError(f"Key {key} is not valid. Expected", valid_keys)
-    if not all(required_keys) not in healthcheck.keys():
+    invalid_keys = healthcheck.keys() - valid_keys
+    if invalid_keys:
+        raise AttributeError(f"Keys {invalid_keys} are not valid. Expected", valid_keys)
+    missing_keys = required_keys - healthcheck.keys()
+    if missing_keys:
         raise AttributeError(
             f"Expected at least {required_keys}. Got", healthcheck.keys()
         )
@@ -97,7 +97,7 @@ class ComposeVolume:
             self.efs_definition = (
                 self.definition[EFS_KEY]["Properties"]
                 if keyisset("Properties", self.efs_definition)
-                else self.efs_defaults
+                else deepcopy(self.efs_defaults)
             )
             self.parameters = (
                 self.definition[EFS_KEY]["MacroParameters"]
@@ -11,15 +11,22 @@ if TYPE_CHECKING:
 import re
 from uuid import uuid4
 
-from compose_x_common.compose_x_common import keyisset, set_else_none
+from compose_x_common.compose_x_common import keyisset
 
 from ecs_composex.common.logging import LOG
 
 from . import ComposeVolume
 
+VOLUME_PATH_RE = re.compile(
+    r"(?:(?P<source>[\S][^:]+):)?(?P<target>/[^:\n]+)(?::(?P<mode>ro|rw|z))?"
+)
+
 
 def match_volumes_services_config(
-    service: ComposeService, vol_config: dict, volumes: list
+    service: ComposeService,
+    vol_config: dict,
+    volumes: list,
+    volumes_by_name: dict = None,
 ):
     """
     Function to map volume config in services and top-level volumes
@@ -27,62 +34,66 @@ def match_volumes_services_config(
     :param service:
     :param vol_config:
     :param volumes:
+    :param volumes_by_name: The top-level volumes indexed by name. Built from volumes if not set.
     :raises LookupError:
     """
-    if keyisset("source", vol_config) and vol_config["source"].startswith(r"/"):
+    source = vol_config.get("source")
+    if not source:
+        raise LookupError(
+            f"Volume configuration {vol_config} has no source defined for {service.name}"
+        )
+    if source.startswith(r"/"):
         vol_config["volume"] = None
         service.volumes.append(vol_config)
-        LOG.info(f"volumes.{vol_config['source']} - Mapped to {service.name}")
+        LOG.info("volumes.%s - Mapped to %s", source, service.name)
+        return
+    if volumes_by_name is None:
+        volumes_by_name = {volume.name: volume for volume in volumes}
+    volume = volumes_by_name.get(source)
+    if volume:
+        volume.services.append(service)
+        vol_config["volume"] = volume
+        service.volumes.append(vol_config)
+        LOG.info("volumes.%s - Mapped to %s", volume.name, service.name)
         return
-    else:
-        for volume in volumes:
-            v_volume = set_else_none("volume", volume)
-            v_source = set_else_none("source", vol_config)
-            if not v_source and not v_volume:
-                LOG.error(f"volumes - Failure to process {volume}")
-                continue
-            if volume.name == v_source:
-                volume.services.append(service)
-                vol_config["volume"] = volume
-                service.volumes.append(vol_config)
-                LOG.info(f"volumes.{volume.name} - Mapped to {service.name}")
-                return
     raise LookupError(
-        f"Volume {vol_config['source']} was not found in {[vol.name for vol in volumes]}"
+        f"Volume {source} was not found in {[vol.name for vol in volumes]}"
     )
 
 
-def handle_volume_str_config(service: ComposeService, config: str, volumes: list):
+def handle_volume_str_config(
+    service: ComposeService, config: str, volumes: list, volumes_by_name: dict = None
+):
     """
     Function to return the volume configuration (long)
     :param ComposeService service:
     :param str config:
     :param list volumes:
+    :param dict volumes_by_name:
     """
     volume_config = {"read_only": False}
-    path_finder = re.compile(
-        r"(?:(?P<source>[\S][^:]+):)?(?P<target>/[^:\n]+)(?::(?P<mode>ro|rw|z))?"
-    )
-    path_match = path_finder.match(config)
+    path_match = VOLUME_PATH_RE.match(config)
     if not path_match or (path_match and not path_match.group("target")):
         raise ValueError(
             f"Volume syntax {config} is invalid. Must follow the pattern",
-            path_finder.pattern,
+            VOLUME_PATH_RE.pattern,
         )
     else:
         volume_config["target"] = path_match.group("target")
         if path_match.group("source"):
             volume_config["source"] = path_match.group("source")
         else:
-            LOG.warning(f"No source defined with {config}. Creating docker volume")
+            LOG.warning("No source defined with %s. Creating docker volume", config)
             new_volume = ComposeVolume(str(uuid4().hex)[:6], {})
             new_volume.autogenerated = True
             volumes.append(new_volume)
+            if volumes_by_name is not None:
+                volumes_by_name[new_volume.name] = new_volume
             volume_config["source"] = new_volume.name
             volume_config["volume"] = new_volume
         if path_match.group("mode") and path_match.group("mode") == "ro":
             volume_config["read_only"] = True
-    match_volumes_services_config(service, volume_config, volumes)
+    match_volumes_services_config(service, volume_config, volumes, volumes_by_name)
 
 
 def is_tmpfs(config: dict) -> bool:
@@ -100,15 +111,19 @@ def is_tmpfs(config: dict) -> bool:
     return False
 
 
-def handle_volume_dict_config(service: ComposeService, config: dict, volumes: list):
+def handle_volume_dict_config(
+    service: ComposeService, config: dict, volumes: list, volumes_by_name: dict = None
+):
     """
     :param ComposeService service:
     :param dict config:
     :param list volumes:
+    :param dict volumes_by_name:
     """
     volume_config = {"read_only": False}
     required_keys = ["target", "source"]
-    if not is_tmpfs(config) and not all(key in config.keys() for key in required_keys):
+    tmpfs = is_tmpfs(config)
+    if not tmpfs and not ("target" in config and "source" in config):
         raise KeyError(
             "Volume configuration, when not tmpfs, requires at least",
             required_keys,
@@ -116,8 +131,8 @@ def handle_volume_dict_config(service: ComposeService, config: dict, volumes: li
             config.keys(),
         )
     volume_config.update(config)
-    if not is_tmpfs(volume_config):
-        match_volumes_services_config(service, volume_config, volumes)
+    if not tmpfs:
+        match_volumes_services_config(service, volume_config, volumes, volumes_by_name)
 
 
 def handle_tmpfs(service: ComposeService, volume: dict) -> None:
@@ -149,19 +164,17 @@ def map_volumes(service: ComposeService, volumes: list = None) -> None:
     :param service: The Service to map the volumes to.
     :param list volumes:
     """
-    if not keyisset(ComposeVolume.main_key, service.definition):
+    service_volumes = service.definition.get(ComposeVolume.main_key)
+    if not service_volumes:
         return
-    for s_volume in service.definition[ComposeVolume.main_key]:
-        if (
-            isinstance(s_volume, dict)
-            and (keyisset("type", s_volume) and s_volume["type"] == "tmpfs")
-            or keyisset("tmpfs", s_volume)
-        ):
+    volumes_by_name = {volume.name: volume for volume in volumes} if volumes else {}
+    for s_volume in service_volumes:
+        if isinstance(s_volume, dict) and is_tmpfs(s_volume):
             handle_tmpfs(service, s_volume)
         else:
             if not volumes:
                 continue
             if isinstance(s_volume, str):
-                handle_volume_str_config(service, s_volume, volumes)
+                handle_volume_str_config(service, s_volume, volumes, volumes_by_name)
             elif isinstance(s_volume, dict):
-                handle_volume_dict_config(service, s_volume, volumes)
+                handle_volume_dict_config(service, s_volume, volumes, volumes_by_name)
@@ -396,14 +396,11 @@ class XResource:
         env_vars = []
         params_to_add = []
 
-        if self.ref_parameter and self.ref_parameter.title in target_definition.keys():
+        if self.ref_parameter and self.ref_parameter.title in target_definition:
             LOG.debug(
                 f"{self.module.res_key}.{self.module.res_key} - Ref parameter {self.ref_parameter.title} override."
             )
-        elif (
-            self.ref_parameter
-            and self.ref_parameter.title not in target_definition.keys()
-        ):
+        elif self.ref_parameter and self.ref_parameter.title not in target_definition:
             env_var_name = ENV_VAR_NAME.sub("", self.name.replace("-", "_").upper())
             target_definition[self.ref_parameter.title] = env_var_name
             LOG.info(
@@ -664,7 +661,7 @@ class XResource:
             return self
         if (
             isinstance(parameter, str)
-            and parameter in self.property_to_parameter_mapping.keys()
+            and parameter in self.property_to_parameter_mapping
         ):
             the_parameter = self.property_to_parameter_mapping[parameter]
         elif (
@@ -54,6 +54,5 @@ def set_template(family) -> Template:
         ecs_conditions.USE_BRIDGE_NETWORKING_MODE_CON_T: ecs_conditions.USE_BRIDGE_NETWORKING_MODE_CON,
         ecs_conditions.USE_AWSVPC_NETWORKING_MODE_CON_T: ecs_conditions.USE_AWSVPC_NETWORKING_MODE_CON,
     }
-    for title, condition in conditions.items():
-        template.add_condition(title, condition)
+    template.conditions.update(conditions)
     return template
@@ -118,7 +118,7 @@ class FireLensFamilyManagedConfiguration:
                 if not keyisset("content", _parser_file_def):
                     continue
                 file_path = f"{self.volume_mount}{_parser_file}"
-                if file_path not in self._parser_files.keys():
+                if file_path not in self._parser_files:
                     self._parser_files[f"{self.volume_mount}{_parser_file}"] = (
                         _parser_file_def
                     )
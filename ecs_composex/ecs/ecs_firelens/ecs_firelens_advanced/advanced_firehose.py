@@ -85,7 +85,7 @@ class FireLensFirehoseManagedDestination:
         }
         for param_name, param_function in param_to_handler.items():
             if (
-                param_name in self._definition.keys()
+                param_name in self._definition
                 and param_function
                 and callable(param_function)
             ):
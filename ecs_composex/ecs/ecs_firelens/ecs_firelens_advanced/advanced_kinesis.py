@@ -86,7 +86,7 @@ class FireLensKinesisManagedDestination:
         }
         for param_name, param_function in param_to_handler.items():
             if (
-                param_name in self._definition.keys()
+                param_name in self._definition
                 and param_function
                 and callable(param_function)
             ):
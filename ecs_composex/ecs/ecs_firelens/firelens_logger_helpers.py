@@ -42,7 +42,7 @@ def handle_firehose_config(
         "role_arn": handle_cross_account_permissions,
     }
     for param_name, param_function in param_to_handler.items():
-        if param_name in service.logging.log_options.keys() and param_function:
+        if param_name in service.logging.log_options and param_function:
             service.logging.log_options[param_name] = param_function(
                 family,
                 service,
@@ -70,7 +70,7 @@ def handle_kinesis_config(
         "role_arn": handle_cross_account_permissions,
     }
     for param_name, param_function in param_to_handler.items():
-        if param_name in service.logging.log_options.keys() and param_function:
+        if param_name in service.logging.log_options and param_function:
             service.logging.log_options[param_name] = param_function(
                 family,
                 service,
@@ -103,7 +103,7 @@ def handle_cloudwatch(
     }
     for param_name, param_function in param_to_handler.items():
         if (
-            param_name in service.logging.log_options.keys()
+            param_name in service.logging.log_options
             and param_function[0]
             and callable(param_function[0])
         ):
@@ -113,7 +113,7 @@ def handle_cloudwatch(
                 settings,
                 param_name,
             )
-        elif param_name in service.logging.log_options.keys() and param_function[1]:
+        elif param_name in service.logging.log_options and param_function[1]:
             if isinstance(param_function[1], (str, int, float)) or not callable(
                 param_function[1]
             ):
@@ -20,11 +20,10 @@ from troposphere.ssm import Parameter as SSMParameter
 
 try:
     from yaml import CDumper as Dumper
-    from yaml import CLoader as Loader
 except ImportError:
     from yaml import Dumper as Dumper
-    from yaml import Loader as Loader
 
+from ecs_composex.common import load_composex_file
 from ecs_composex.common.cfn_params import STACK_ID_SHORT
 from ecs_composex.common.troposphere_tools import add_resource
 from ecs_composex.ecs import ecs_params
@@ -46,10 +45,9 @@ def set_cw_prometheus_config_parameter(
     if keyisset("ScrapingConfiguration", options):
         scrape_config = options["ScrapingConfiguration"]
     if keyisset("ScrapingConfigurationFile", scrape_config):
-        with open(
+        value_py = load_composex_file(
             path.abspath(scrape_config["ScrapingConfigurationFile"])
-        ) as config_fd:
-            value_py = yaml.load(config_fd.read(), Loader=Loader)
+        )
     else:
         value_py = {
             "global": {
@@ -100,12 +100,9 @@ def define_deployment_options(family, props: dict) -> None:
     :param ecs_composex.ecs.ecs_family.ComposeFamily family:
     :param dict props: the troposphere.ecs.Service properties definition to update with deployment config.
     """
-    default = DeploymentConfiguration(
-        DeploymentCircuitBreaker=DeploymentCircuitBreaker(Enable=True, Rollback=True),
-    )
     deployment_config = set_service_update_config(family)
     if deployment_config:
-        deploy_config = DeploymentConfiguration(
+        props["DeploymentConfiguration"] = DeploymentConfiguration(
             MaximumPercent=int(deployment_config["MaximumPercent"]),
             MinimumHealthyPercent=int(deployment_config["MinimumHealthyPercent"]),
             DeploymentCircuitBreaker=DeploymentCircuitBreaker(
@@ -113,9 +110,12 @@ def define_deployment_options(family, props: dict) -> None:
                 Rollback=keyisset("RollBack", deployment_config),
             ),
         )
-        props.update({"DeploymentConfiguration": deploy_config})
     else:
-        props.update({"DeploymentConfiguration": default})
+        props["DeploymentConfiguration"] = DeploymentConfiguration(
+            DeploymentCircuitBreaker=DeploymentCircuitBreaker(
+                Enable=True, Rollback=True
+            ),
+        )
 
 
 def set_service_default_tags_labels(family) -> Tags:
@@ -16,7 +16,7 @@ def merge_capacity_providers(service_compute):
         if not svc.capacity_provider_strategy or svc.is_aws_sidecar:
             continue
         for provider in svc.capacity_provider_strategy:
-            if provider["CapacityProvider"] not in task_config.keys():
+            if provider["CapacityProvider"] not in task_config:
                 name = provider["CapacityProvider"]
                 task_config[name] = {
                     "Base": [],
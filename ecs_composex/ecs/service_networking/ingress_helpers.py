@@ -240,7 +240,7 @@ def handle_str_cloudmap_config(
     :param str cloudmap_config:
     :param list ports:
     """
-    if cloudmap_config not in family_mappings.keys():
+    if cloudmap_config not in family_mappings:
         family_mappings[cloudmap_config] = {
             "Port": ports[0],
             "Name": family.family_hostname,
@@ -264,7 +264,7 @@ def handle_dict_cloudmap_config(
     :param list ports:
     """
     for map_name, config in cloudmap_config.items():
-        if map_name in family_mappings.keys():
+        if map_name in family_mappings:
             LOG.warning(
                 f"{family.name}.x-network.x-cloudmap - {cloudmap_config} is set multiple times. "
                 f"Preserving {family_mappings[map_name]}"
@@ -329,7 +329,7 @@ def define_tracking_target_configuration(
             "property": "ALBRequestCountPerTarget",
         },
     }
-    if config_key not in settings.keys():
+    if config_key not in settings:
         raise KeyError(config_key, "Is invalid. Expected one of", settings.keys())
     specification = applicationautoscaling.PredefinedMetricSpecification(
         PredefinedMetricType=settings[config_key]["property"]
@@ -48,7 +48,6 @@ from ecs_composex.ecs.ecs_params import CLUSTER_NAME, CLUSTER_T
 from ecs_composex.ecs_cluster.ecs_cluster_params import (
     DEFAULT_STRATEGY,
     FARGATE_PROVIDERS,
-    RES_KEY,
 )
 from ecs_composex.ecs_cluster.helpers import (
     evaluate_capacity_providers,
@@ -72,13 +71,12 @@ def add_ecs_cluster(settings):
     if keyisset("x-aws-cluster", settings.compose_content):
         import_from_x_aws_cluster(settings.compose_content)
         LOG.info("x-aws-cluster was set. Overriding any defined x-cluster settings")
-    if not keyisset(EcsCluster.res_key, settings.compose_content):
+    cluster_definition = settings.compose_content.get(EcsCluster.res_key)
+    if not cluster_definition:
         LOG.info("No cluster information provided. Creating a new one")
         cluster = EcsCluster(settings.root_stack)
-    elif isinstance(settings.compose_content[RES_KEY], dict):
-        cluster = EcsCluster(
-            settings.root_stack, settings.compose_content[EcsCluster.res_key]
-        )
+    elif isinstance(cluster_definition, dict):
+        cluster = EcsCluster(settings.root_stack, cluster_definition)
         cluster.set_from_definition(settings.root_stack, settings.session, settings)
     else:
         raise LookupError("Unable to determine what to do for x-cluster")
@@ -200,18 +198,16 @@ class EcsCluster:
 
         :param dict cluster_api_def:
         """
-        if keyisset("Configuration", cluster_api_def):
-            config = cluster_api_def["Configuration"]
-            if keyisset("ExecuteCommandConfiguration", config):
-                exec_config = config["ExecuteCommandConfiguration"]
-                if keyisset("KmsKeyId", exec_config):
-                    self.mappings[CLUSTER_NAME.title]["KmsKeyId"] = exec_config[
-                        "KmsKeyId"
-                    ]
-                    self.log_key = FindInMap(
-                        self.mappings_key, CLUSTER_NAME.title, "KmsKeyId"
-                    )
-                self.import_log_config(exec_config)
+        exec_config = (cluster_api_def.get("Configuration") or {}).get(
+            "ExecuteCommandConfiguration"
+        )
+        if not exec_config:
+            return
+        kms_key_id = exec_config.get("KmsKeyId")
+        if kms_key_id:
+            self.mappings[CLUSTER_NAME.title]["KmsKeyId"] = kms_key_id
+            self.log_key = FindInMap(self.mappings_key, CLUSTER_NAME.title, "KmsKeyId")
+        self.import_log_config(exec_config)
 
     def lookup_cluster(self, session):
         """
@@ -244,7 +240,7 @@ class EcsCluster:
             clusters_config = describe_all_ecs_clusters_from_ccapi(
                 clusters, return_as_map=True, use_cluster_name=True, session=ecs_session
             )
-            if cluster_name not in clusters_config.keys():
+            if cluster_name not in clusters_config:
                 raise LookupError(
                     f"Failed to find {cluster_name}. Available clusters are",
                     cluster_names,
@@ -84,15 +84,11 @@ def determine_resource_type(name, properties):
     :param dict properties:
     :return:
     """
-    if all(
-        property_name in CacheCluster.props.keys()
-        for property_name in properties.keys()
-    ):
+    if all(property_name in CacheCluster.props for property_name in properties.keys()):
         LOG.info(f"Identified {name} to be {CacheCluster.resource_type}")
         return CacheCluster
     elif all(
-        property_name in ReplicationGroup.props.keys()
-        for property_name in properties.keys()
+        property_name in ReplicationGroup.props for property_name in properties.keys()
     ):
         LOG.info(f"Identified {name} to be {ReplicationGroup.resource_type}")
         return ReplicationGroup
@@ -165,10 +161,8 @@ def create_cluster_from_parameters(cluster, template):
     :param template:
     :return:
     """
-    required_keys = ["Engine", "EngineVersion"]
-    if not cluster.properties and not all(
-        key in required_keys for key in cluster.parameters
-    ):
+    required_keys = frozenset(("Engine", "EngineVersion"))
+    if not cluster.properties and required_keys - cluster.parameters.keys():
         raise KeyError(
             "When using MacroParameters only, you must specify at least",
             required_keys,
@@ -436,7 +436,7 @@ def validate_target_group_attributes(target_attributes, validation, lb_type):
     :raises: ValueError
     """
     for attr in target_attributes:
-        if attr.Key not in validation.keys():
+        if attr.Key not in validation:
             raise ValueError(
                 f"Attribute {attr.Key} is not compatible with {lb_type}. Valid ones",
                 validation.keys(),
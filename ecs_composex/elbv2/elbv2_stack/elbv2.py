@@ -346,7 +346,7 @@ class Elbv2(NetworkXResource):
         :rtype: str
         """
         if self.subnets_override:
-            if self.subnets_override not in vpc_stack.vpc_resource.mappings.keys():
+            if self.subnets_override not in vpc_stack.vpc_resource.mappings:
                 raise KeyError(
                     f"The subnets indicated for {self.name} is not valid. Valid ones are",
                     vpc_stack.vpc_resource.mappings.keys(),
@@ -409,7 +409,7 @@ class Elbv2(NetworkXResource):
             self.subnets_override
             and not vpc_stack.vpc_resource.cfn_resource
             and vpc_stack.vpc_resource.mappings
-            and self.subnets_override in vpc_stack.vpc_resource.mappings.keys()
+            and self.subnets_override in vpc_stack.vpc_resource.mappings
         ):
             return Ref(self.subnets_override)
         elif self.lb_is_public:
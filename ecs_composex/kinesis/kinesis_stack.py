@@ -12,6 +12,8 @@ if TYPE_CHECKING:
     from ecs_composex.common.settings import ComposeXSettings
     from ecs_composex.mods_manager import XResourceModule, ModManager
 
+from functools import partial
+
 from botocore.exceptions import ClientError
 from compose_x_common.aws.kinesis import KINESIS_STREAM_ARN_RE
 from compose_x_common.compose_x_common import attributes_to_mapping, keyisset
@@ -30,15 +32,20 @@ from .kcl_helpers import add_cloudwatch_metric_data_permission, add_dynamodb_per
 from .kinesis_kinesis_firehose import kinesis_to_firehose
 
 
-def get_stream_config(stream, account_id, resource_id):
+def get_stream_config(stream, account_id, resource_id, streams_config: dict = None):
     """
     Function to get the configuration of KMS Stream from API
 
     :param Stream stream:
     :param str account_id:
     :param str resource_id:
+    :param dict streams_config: Streams already described, by account, region and stream name.
     :return:
     """
+    cache_key = (account_id, stream.lookup_session.region_name, resource_id)
+    if streams_config is not None and cache_key in streams_config:
+        stream_config = streams_config[cache_key]
+        return dict(stream_config) if stream_config else None
     client = stream.lookup_session.client("kinesis")
     stream_mapping = {
         STREAM_ARN: "StreamDescription::StreamARN",
@@ -48,11 +55,14 @@ def get_stream_config(stream, account_id, resource_id):
     try:
         stream_r = client.describe_stream(StreamName=resource_id)
         stream_config = attributes_to_mapping(stream_r, stream_mapping)
-        return stream_config
     except client.exceptions.ResourceNotFoundException:
-        return None
+        stream_config = None
     except ClientError as error:
         LOG.error(error)
+        return None
+    if streams_config is not None:
+        streams_config[cache_key] = stream_config
+    return dict(stream_config) if stream_config else None
 
 
 class Stream(ApiXResource):
@@ -151,7 +161,8 @@ class Stream(ApiXResource):
                 continue
             if not resource.stack:
                 LOG.debug(
-                    f"resource {resource.name} has no `stack` attribute defined. Skipping"
+                    "resource %s has no `stack` attribute defined. Skipping",
+                    resource.name,
                 )
                 continue
             mappings = [(DeliveryStream, kinesis_to_firehose)]
@@ -171,21 +182,25 @@ def resolve_lookup(
     lookup_resources: list[Stream], settings: ComposeXSettings, module: XResourceModule
 ) -> None:
     """
-    Lookup AWS Kinesis streams and creates CFN Mappings
+    Lookup AWS Kinesis streams and creates CFN Mappings.
+    Streams used by more than one x-kinesis resource are only described once per lookup.
     """
     if not keyisset(module.mapping_key, settings.mappings):
         settings.mappings[module.mapping_key] = {}
+    get_config = partial(get_stream_config, streams_config={})
     for resource in lookup_resources:
         LOG.info(
-            f"{resource.module.res_key}.{resource.logical_name} - Looking up AWS Resource"
+            "%s.%s - Looking up AWS Resource",
+            resource.module.res_key,
+            resource.logical_name,
         )
         resource.lookup_resource(
             KINESIS_STREAM_ARN_RE,
-            get_stream_config,
+            get_config,
             CfnStream.resource_type,
             "kinesis:stream",
         )
-        LOG.info(f"{module.res_key}.{resource.name} - Matched to {resource.arn}")
+        LOG.info("%s.%s - Matched to %s", module.res_key, resource.name, resource.arn)
         settings.mappings[module.mapping_key].update(
             {resource.logical_name: resource.mappings}
         )
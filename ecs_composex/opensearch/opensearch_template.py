@@ -529,7 +529,7 @@ def validate_instance_types(domain, props):
         if not hasattr(cluster_config, cluster_type_prop):
             continue
         defined_type = getattr(cluster_config, cluster_type_prop).split(".")[0]
-        if defined_type not in instance_types.keys():
+        if defined_type not in instance_types:
             raise ValueError(
                 f"{domain.name} - Instance Type for {cluster_type_prop} is not valid",
                 getattr(cluster_config, cluster_type_prop),
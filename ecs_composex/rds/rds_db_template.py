@@ -86,35 +86,17 @@ def init_database_template(db: Rds) -> Template:
             PUBLIC_SUBNETS,
         ],
     )
-    template.add_condition(
-        rds_conditions.USE_DB_SNAPSHOT_CON_T, rds_conditions.USE_DB_SNAPSHOT_CON
-    )
-    template.add_condition(
-        rds_conditions.NOT_USE_DB_SNAPSHOT_CON_T,
-        rds_conditions.NOT_USE_DB_SNAPSHOT_CON,
-    )
-    template.add_condition(
-        rds_conditions.USE_CLUSTER_CON_T, rds_conditions.USE_CLUSTER_CON
-    )
-    template.add_condition(
-        rds_conditions.NOT_USE_CLUSTER_CON_T, rds_conditions.NOT_USE_CLUSTER_CON
-    )
-    template.add_condition(
-        rds_conditions.USE_CLUSTER_AND_SNAPSHOT_CON_T,
-        rds_conditions.USE_CLUSTER_AND_SNAPSHOT_CON,
-    )
-    template.add_condition(
-        rds_conditions.USE_CLUSTER_NOT_SNAPSHOT_CON_T,
-        rds_conditions.USE_CLUSTER_NOT_SNAPSHOT_CON,
-    )
-    template.add_condition(
-        rds_conditions.NOT_USE_CLUSTER_USE_SNAPSHOT_CON_T,
-        rds_conditions.NOT_USE_CLUSTER_USE_SNAPSHOT_CON,
-    )
-    template.add_condition(
-        rds_conditions.USE_CLUSTER_OR_SNAPSHOT_CON_T,
-        rds_conditions.USE_CLUSTER_OR_SNAPSHOT_CON,
-    )
+    conditions = {
+        rds_conditions.USE_DB_SNAPSHOT_CON_T: rds_conditions.USE_DB_SNAPSHOT_CON,
+        rds_conditions.NOT_USE_DB_SNAPSHOT_CON_T: rds_conditions.NOT_USE_DB_SNAPSHOT_CON,
+        rds_conditions.USE_CLUSTER_CON_T: rds_conditions.USE_CLUSTER_CON,
+        rds_conditions.NOT_USE_CLUSTER_CON_T: rds_conditions.NOT_USE_CLUSTER_CON,
+        rds_conditions.USE_CLUSTER_AND_SNAPSHOT_CON_T: rds_conditions.USE_CLUSTER_AND_SNAPSHOT_CON,
+        rds_conditions.USE_CLUSTER_NOT_SNAPSHOT_CON_T: rds_conditions.USE_CLUSTER_NOT_SNAPSHOT_CON,
+        rds_conditions.NOT_USE_CLUSTER_USE_SNAPSHOT_CON_T: rds_conditions.NOT_USE_CLUSTER_USE_SNAPSHOT_CON,
+        rds_conditions.USE_CLUSTER_OR_SNAPSHOT_CON_T: rds_conditions.USE_CLUSTER_OR_SNAPSHOT_CON,
+    }
+    template.conditions.update(conditions)
     return template
 
 
@@ -440,10 +422,7 @@ def determine_resource_type(db_name: str, properties: dict) -> type | None:
     if (
         keyisset(DB_ENGINE_NAME.title, properties)
         and properties[DB_ENGINE_NAME.title].startswith("aurora")
-        or all(
-            property_name in DBCluster.props.keys()
-            for property_name in properties.keys()
-        )
+        or all(property_name in DBCluster.props for property_name in properties.keys())
     ):
         LOG.info(f"Identified {db_name} to be a RDS Aurora Cluster")
         return DBCluster
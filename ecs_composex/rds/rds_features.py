@@ -115,9 +115,8 @@ def add_rds_features(settings, db, db_stack, features, boundary):
     )
     features_definition = []
     for feature in to_add:
-        if feature["Name"] not in features_settings.keys() or not (
-            feature["Name"] in features_settings.keys()
-            and features_settings[feature["Name"]]
+        if feature["Name"] not in features_settings or not (
+            feature["Name"] in features_settings and features_settings[feature["Name"]]
         ):
             LOG.warning(
                 f"The feature {feature['Name']} is not currently supported. Sorry."
@@ -48,7 +48,7 @@ def get_db_cluster_engine_parameter_group_defaults(
         LOG.exception(error)
         return None
     params_return = {}
-    if "EngineDefaults" in req.keys():
+    if "EngineDefaults" in req:
         params = req["EngineDefaults"]["Parameters"]
         for param in params:
             if (
@@ -268,10 +268,7 @@ def define_iam_permissions(
         if not sid_override
         else sid_override
     )
-    if (
-        resource_mapping_key
-        not in dest_resource.iam_manager.iam_modules_policies.keys()
-    ):
+    if resource_mapping_key not in dest_resource.iam_manager.iam_modules_policies:
         dest_resource.iam_manager.iam_modules_policies[resource_mapping_key] = (
             PolicyType(
                 policy_title,
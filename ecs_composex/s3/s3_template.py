@@ -112,7 +112,7 @@ def handle_predefined_policies(
         set(bucket.parameters[param_key]["PredefinedBucketPolicies"])
     )
     for policy_name in unique_policies:
-        if policy_name not in bucket.module.iam_policies[managed_policies_key].keys():
+        if policy_name not in bucket.module.iam_policies[managed_policies_key]:
             LOG.error(
                 f"Policy {policy_name} is not defined as part of possible permissions set"
             )
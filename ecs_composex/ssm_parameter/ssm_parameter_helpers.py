@@ -18,8 +18,8 @@ import yaml
 from compose_x_common.compose_x_common import keyisset
 from troposphere import Base64
 from troposphere.ssm import Parameter as CfnSsmParameter
-from yaml import Loader
 
+from ecs_composex.common import Loader
 from ecs_composex.common.logging import LOG
 from ecs_composex.common.troposphere_tools import add_outputs
 from ecs_composex.resources_import import import_record_properties
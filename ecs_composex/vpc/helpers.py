@@ -95,7 +95,7 @@ def define_vpc_settings(
     elif (
         vpc_stack.vpc_resource
         and vpc_stack.vpc_resource.cfn_resource
-        and vpc_stack.title not in settings.root_stack.stack_template.resources.keys()
+        and vpc_stack.title not in settings.root_stack.stack_template.resources
     ):
         add_resource(settings.root_stack.stack_template, vpc_stack)
         LOG.info(f"{settings.name}.x-vpc - VPC stack added. A new VPC will be created.")
@@ -193,10 +193,7 @@ class Vpc(AwsEnvironmentResource):
         self.subnets_parameters.append(PUBLIC_SUBNETS)
         self.subnets_parameters.append(STORAGE_SUBNETS)
         for setting_name in vpc_settings:
-            if (
-                setting_name not in self.mappings.keys()
-                and setting_name not in ignored_keys
-            ):
+            if setting_name not in self.mappings and setting_name not in ignored_keys:
                 self.mappings[setting_name] = {"Ids": vpc_settings[setting_name]}
                 param = Parameter(setting_name, Type=SUBNETS_TYPE)
                 self.subnets_parameters.append(param)
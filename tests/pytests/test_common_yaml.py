@@ -0,0 +1,70 @@
+#  -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from types import SimpleNamespace
+
+import yaml
+from pytest import fixture, raises
+from troposphere import Template
+
+from ecs_composex.common import _get_yaml_loader, load_composex_file
+from ecs_composex.ecs.ecs_prometheus.config_ssm_parameters import (
+    set_cw_prometheus_config_parameter,
+)
+from ecs_composex.ssm_parameter.ssm_parameter_helpers import handle_yaml_validation
+
+
+@fixture()
+def yaml_file(tmp_path):
+    file_path = tmp_path / "config.yaml"
+    file_path.write_text("global:\n  scrape_interval: 1m\nscrape_configs: []\n")
+    return str(file_path)
+
+
+@fixture()
+def unsafe_yaml():
+    return "key: !!python/object/apply:os.getcwd []\n"
+
+
+def test_pure_python_loader_env_var(monkeypatch):
+    monkeypatch.setenv("COMPOSEX_PY_YAML", "1")
+    assert _get_yaml_loader() is yaml.SafeLoader
+    monkeypatch.delenv("COMPOSEX_PY_YAML")
+    assert _get_yaml_loader() is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def test_load_composex_file(yaml_file):
+    assert load_composex_file(yaml_file) == {
+        "global": {"scrape_interval": "1m"},
+        "scrape_configs": [],
+    }
+
+
+def test_load_composex_file_is_safe(tmp_path, unsafe_yaml):
+    file_path = tmp_path / "unsafe.yaml"
+    file_path.write_text(unsafe_yaml)
+    with raises(yaml.YAMLError):
+        load_composex_file(str(file_path))
+
+
+def test_ssm_parameter_yaml_validation_is_safe(unsafe_yaml):
+    resource = SimpleNamespace(name="param", parameters={})
+    assert handle_yaml_validation(resource, "a: 1\n", "param.yaml") == "a: 1\n"
+    with raises(yaml.YAMLError):
+        handle_yaml_validation(resource, unsafe_yaml, "param.yaml")
+
+
+def test_prometheus_scraping_config_file(yaml_file, tmp_path, unsafe_yaml):
+    family = SimpleNamespace(logical_name="app", template=Template())
+    parameter = set_cw_prometheus_config_parameter(
+        family, {"ScrapingConfiguration": {"ScrapingConfigurationFile": yaml_file}}
+    )
+    assert "scrape_interval: 1m" in parameter.Value.to_dict()["Fn::Sub"][0]
+    unsafe_file = tmp_path / "unsafe.yaml"
+    unsafe_file.write_text(unsafe_yaml)
+    with raises(yaml.YAMLError):
+        set_cw_prometheus_config_parameter(
+            family,
+            {"ScrapingConfiguration": {"ScrapingConfigurationFile": str(unsafe_file)}},
+        )
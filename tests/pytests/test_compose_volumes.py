@@ -0,0 +1,87 @@
+#  -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from types import SimpleNamespace
+
+from pytest import fixture, raises
+
+from ecs_composex.compose.compose_volumes import ComposeVolume
+from ecs_composex.compose.compose_volumes.services_helpers import (
+    handle_volume_str_config,
+    map_volumes,
+)
+
+
+def make_service(volumes_definition):
+    return SimpleNamespace(
+        name="app",
+        volumes=[],
+        tmpfses=[],
+        definition={"volumes": volumes_definition},
+    )
+
+
+@fixture()
+def volumes():
+    return [ComposeVolume("shared", {}), ComposeVolume("cache", {})]
+
+
+def test_map_host_path(volumes):
+    service = make_service(["/host/path:/data"])
+    map_volumes(service, volumes)
+    assert service.volumes == [
+        {
+            "read_only": False,
+            "target": "/data",
+            "source": "/host/path",
+            "volume": None,
+        }
+    ]
+    assert not any(volume.services for volume in volumes)
+
+
+def test_map_named_volume(volumes):
+    service = make_service(
+        ["shared:/shared:ro", {"source": "cache", "target": "/cache"}]
+    )
+    map_volumes(service, volumes)
+    assert [config["volume"] for config in service.volumes] == volumes
+    assert service.volumes[0]["read_only"] is True
+    assert service.volumes[1]["target"] == "/cache"
+    assert volumes[0].services == [service]
+    assert volumes[1].services == [service]
+
+
+def test_map_autogenerated_volume(volumes):
+    service = make_service(["/anon"])
+    map_volumes(service, volumes)
+    assert len(volumes) == 3
+    new_volume = volumes[-1]
+    assert new_volume.autogenerated
+    assert service.volumes[0]["source"] == new_volume.name
+    assert service.volumes[0]["volume"] is new_volume
+    assert new_volume.services == [service]
+
+
+def test_autogenerated_volume_in_index(volumes):
+    service = make_service([])
+    volumes_by_name = {volume.name: volume for volume in volumes}
+    handle_volume_str_config(service, "/anon", volumes, volumes_by_name)
+    new_volume = volumes[-1]
+    assert volumes_by_name[new_volume.name] is new_volume
+    assert service.volumes[0]["volume"] is new_volume
+    assert new_volume.services == [service]
+
+
+def test_missing_source(volumes):
+    service = make_service([{"source": "", "target": "/data"}])
+    with raises(LookupError, match="has no source"):
+        map_volumes(service, volumes)
+    assert not service.volumes
+
+
+def test_volume_not_found(volumes):
+    service = make_service(["unknown:/data"])
+    with raises(LookupError, match="unknown was not found"):
+        map_volumes(service, volumes)
@@ -0,0 +1,94 @@
+#  -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from os import path
+from types import SimpleNamespace
+
+import placebo
+from boto3.session import Session
+from pytest import fixture, raises
+
+from ecs_composex.kinesis.kinesis_params import (
+    STREAM_ARN,
+    STREAM_ID,
+    STREAM_KMS_KEY_ID,
+)
+from ecs_composex.kinesis.kinesis_stack import resolve_lookup
+
+HERE = path.abspath(path.dirname(__file__))
+
+
+def fake_stream(index, session, fail=False):
+    """Stream stand-in which looks itself up with the native lookup function only"""
+    stream = SimpleNamespace(
+        name=f"stream-{index:02d}",
+        logical_name=f"stream{index:02d}",
+        arn=None,
+        module=SimpleNamespace(res_key="x-kinesis"),
+        lookup_session=session,
+        mappings={},
+    )
+
+    def lookup_resource(arn_re, native_lookup_function, *args):
+        if fail:
+            raise LookupError(f"{stream.name} not found")
+        properties = native_lookup_function(stream, "000000000000", stream.name)
+        stream.arn = properties[STREAM_ARN]
+        stream.mappings = {
+            parameter.title: value for parameter, value in properties.items()
+        }
+
+    stream.lookup_resource = lookup_resource
+    return stream
+
+
+@fixture()
+def session():
+    client_session = Session(region_name="eu-west-1")
+    pill = placebo.attach(
+        session=client_session, data_path=f"{HERE}/placebos/lookup_x_kinesis"
+    )
+    pill.playback()
+    return client_session
+
+
+@fixture()
+def settings():
+    return SimpleNamespace(mappings={})
+
+
+@fixture()
+def module():
+    return SimpleNamespace(mapping_key="kinesis", res_key="x-kinesis")
+
+
+def test_resolve_lookup_placebo(session, settings, module):
+    streams = [fake_stream(1, session)]
+    resolve_lookup(streams, settings, module)
+    assert settings.mappings["kinesis"]["stream01"] == {
+        STREAM_ARN.title: "arn:aws:kinesis:eu-west-1:000000000000:stream/stream-01",
+        STREAM_ID.title: "stream-01",
+        STREAM_KMS_KEY_ID.title: "alias/aws/kinesis",
+    }
+    assert streams[0].arn == settings.mappings["kinesis"]["stream01"][STREAM_ARN.title]
+
+
+def test_resolve_lookup_mappings_order(session, settings, module):
+    streams = [fake_stream(index, session) for index in range(4)]
+    resolve_lookup(streams, settings, module)
+    assert list(settings.mappings["kinesis"]) == [
+        stream.logical_name for stream in streams
+    ]
+
+
+def test_resolve_lookup_no_resources(settings, module):
+    resolve_lookup([], settings, module)
+    assert settings.mappings == {"kinesis": {}}
+
+
+def test_resolve_lookup_error(session, settings, module):
+    streams = [fake_stream(index, session, fail=index == 2) for index in range(4)]
+    with raises(LookupError, match="stream-02 not found"):
+        resolve_lookup(streams, settings, module)
+    assert list(settings.mappings["kinesis"]) == ["stream00", "stream01"]
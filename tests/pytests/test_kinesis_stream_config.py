@@ -0,0 +1,103 @@
+#  -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from pytest import fixture
+
+from ecs_composex.kinesis.kinesis_params import STREAM_ARN, STREAM_ID
+from ecs_composex.kinesis.kinesis_stack import get_stream_config, resolve_lookup
+
+STREAM_DESCRIPTION = {
+    "StreamDescription": {
+        "StreamName": "stream",
+        "StreamARN": "arn:aws:kinesis:eu-west-1:012345678912:stream/stream",
+        "KeyId": "alias/aws/kinesis",
+    }
+}
+
+
+@fixture()
+def client():
+    client = MagicMock()
+    client.exceptions.ResourceNotFoundException = type(
+        "ResourceNotFoundException", (Exception,), {}
+    )
+    client.describe_stream.return_value = STREAM_DESCRIPTION
+    return client
+
+
+@fixture()
+def session(client):
+    session = MagicMock(region_name="eu-west-1")
+    session.client.return_value = client
+    return session
+
+
+def fake_stream(name, session):
+    """Stream stand-in which looks up the stream named `stream` with the native lookup function"""
+    stream = SimpleNamespace(
+        name=name,
+        logical_name=name,
+        arn=None,
+        module=SimpleNamespace(res_key="x-kinesis"),
+        lookup_session=session,
+        mappings={},
+    )
+
+    def lookup_resource(arn_re, native_lookup_function, *args):
+        properties = native_lookup_function(stream, "012345678912", "stream")
+        stream.arn = properties[STREAM_ARN]
+        stream.mappings = {
+            parameter.title: value for parameter, value in properties.items()
+        }
+
+    stream.lookup_resource = lookup_resource
+    return stream
+
+
+def test_describe_stream_once(session, client):
+    streams_config = {}
+    stream = SimpleNamespace(lookup_session=session)
+    first = get_stream_config(stream, "012345678912", "stream", streams_config)
+    second = get_stream_config(stream, "012345678912", "stream", streams_config)
+    client.describe_stream.assert_called_once_with(StreamName="stream")
+    assert first == second
+    assert first[STREAM_ID] == "stream"
+
+
+def test_stream_config_copies(session):
+    streams_config = {}
+    stream = SimpleNamespace(lookup_session=session)
+    first = get_stream_config(stream, "012345678912", "stream", streams_config)
+    first[STREAM_ARN] = "changed"
+    second = get_stream_config(stream, "012345678912", "stream", streams_config)
+    assert first is not second
+    assert second[STREAM_ARN] == STREAM_DESCRIPTION["StreamDescription"]["StreamARN"]
+
+
+def test_stream_not_found(session, client):
+    client.describe_stream.side_effect = client.exceptions.ResourceNotFoundException
+    streams_config = {}
+    stream = SimpleNamespace(lookup_session=session)
+    assert get_stream_config(stream, "012345678912", "stream", streams_config) is None
+    assert get_stream_config(stream, "012345678912", "stream", streams_config) is None
+    client.describe_stream.assert_called_once_with(StreamName="stream")
+
+
+def test_resolve_lookup_same_stream(session, client):
+    settings = SimpleNamespace(mappings={})
+    module = SimpleNamespace(mapping_key="kinesis", res_key="x-kinesis")
+    streams = [fake_stream("producer", session), fake_stream("consumer", session)]
+    resolve_lookup(streams, settings, module)
+    client.describe_stream.assert_called_once_with(StreamName="stream")
+    assert settings.mappings["kinesis"]["producer"] == (
+        settings.mappings["kinesis"]["consumer"]
+    )
+    assert settings.mappings["kinesis"]["producer"] is not (
+        settings.mappings["kinesis"]["consumer"]
+    )
+    resolve_lookup(streams, settings, module)
+    assert client.describe_stream.call_count == 2
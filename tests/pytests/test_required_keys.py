@@ -0,0 +1,79 @@
+#  -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from types import SimpleNamespace
+
+from pytest import fixture, raises
+from troposphere import Template
+from troposphere.ec2 import SecurityGroup
+from troposphere.elasticache import SubnetGroup
+
+from ecs_composex.compose.compose_services.helpers import validate_healthcheck
+from ecs_composex.elasticache.elasticache_template import (
+    create_cluster_from_parameters,
+)
+
+HEALTHCHECK_VALID_KEYS = frozenset(
+    ("test", "interval", "timeout", "retries", "start_period")
+)
+HEALTHCHECK_REQUIRED_KEYS = frozenset(("test",))
+
+
+@fixture()
+def cluster():
+    return SimpleNamespace(
+        name="cache",
+        logical_name="cache",
+        properties={},
+        parameters={},
+        cfn_resource=None,
+        db_sg=SecurityGroup("cacheSg", GroupDescription="cache"),
+        db_subnet_group=SubnetGroup(
+            "cacheSubnetGroup", Description="cache", SubnetIds=["subnet-abcd"]
+        ),
+    )
+
+
+def test_healthcheck_valid():
+    validate_healthcheck(
+        {"test": ["CMD", "true"], "interval": "10s", "retries": 3},
+        HEALTHCHECK_VALID_KEYS,
+        HEALTHCHECK_REQUIRED_KEYS,
+    )
+
+
+def test_healthcheck_missing_keys():
+    with raises(AttributeError, match="Expected at least"):
+        validate_healthcheck(
+            {"interval": "10s"}, HEALTHCHECK_VALID_KEYS, HEALTHCHECK_REQUIRED_KEYS
+        )
+
+
+def test_healthcheck_invalid_keys():
+    with raises(AttributeError, match="not valid"):
+        validate_healthcheck(
+            {"test": ["CMD", "true"], "disable": True},
+            HEALTHCHECK_VALID_KEYS,
+            HEALTHCHECK_REQUIRED_KEYS,
+        )
+
+
+def test_cluster_from_parameters(cluster):
+    cluster.parameters = {"Engine": "redis", "EngineVersion": "6.2"}
+    template = Template()
+    create_cluster_from_parameters(cluster, template)
+    assert template.resources["cache"] is cluster.cfn_resource
+    props = cluster.cfn_resource.to_dict()["Properties"]
+    assert props["Engine"] == "redis"
+    assert props["EngineVersion"] == "6.2"
+    assert props["CacheNodeType"] == "cache.t3.small"
+
+
+def test_cluster_from_parameters_missing_keys(cluster):
+    for parameters in ({}, {"Engine": "redis"}, {"EngineVersion": "6.2"}):
+        cluster.parameters = parameters
+        template = Template()
+        with raises(KeyError):
+            create_cluster_from_parameters(cluster, template)
+        assert not template.resources
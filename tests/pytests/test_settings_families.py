@@ -0,0 +1,55 @@
+#  -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from re import sub
+from types import SimpleNamespace
+
+from pytest import fixture, raises
+
+from ecs_composex.common.settings import ComposeXSettings
+
+
+@fixture()
+def settings():
+    """Settings stand-in recording the families set_families creates, by formatted name"""
+    settings = SimpleNamespace(services=[], families={})
+
+    def add_new_family(family_name, service, assigned_services):
+        settings.families[sub(r"[^a-zA-Z0-9]+", "", family_name)] = SimpleNamespace(
+            name=family_name, ordered_services=[service]
+        )
+
+    def add_service_to_family(family_name, service, assigned_services):
+        settings.families[family_name].ordered_services.append(service)
+
+    settings.add_new_family = add_new_family
+    settings.add_service_to_family = add_service_to_family
+    return settings
+
+
+def test_invalid_family_names_reported_together(settings):
+    settings.services = [
+        SimpleNamespace(name="app", families=["app", "--"]),
+        SimpleNamespace(name="worker", families=["_"]),
+    ]
+    with raises(ValueError) as error:
+        ComposeXSettings.set_families(settings)
+    assert error.value.args[1] == ["--", "_"]
+    assert not settings.families
+
+
+def test_family_names_with_punctuation(settings):
+    settings.services = [
+        SimpleNamespace(name="app", families=["my-fam"]),
+        SimpleNamespace(name="worker", families=["my_fam", "other.fam"]),
+        SimpleNamespace(name="proxy", families=["my-fam"]),
+    ]
+    ComposeXSettings.set_families(settings)
+    assert list(settings.families) == ["myfam", "otherfam"]
+    assert [
+        service.name for service in settings.families["myfam"].ordered_services
+    ] == ["app", "worker", "proxy"]
+    assert [
+        service.name for service in settings.families["otherfam"].ordered_services
+    ] == ["worker"]
@@ -0,0 +1,44 @@
+#  -*- coding: utf-8 -*-
+# SPDX-License-Identifier: MPL-2.0
+# Copyright 2020-2022 John Mille <john@compose-x.io>
+
+from pytest import raises
+from troposphere import MAX_PARAMETERS
+from troposphere import Parameter as CfnParameter
+from troposphere import Template
+
+from ecs_composex.common.cfn_params import Parameter
+from ecs_composex.common.troposphere_tools import add_parameters
+
+
+def test_add_parameters_first_wins():
+    template = Template()
+    existing = CfnParameter("Existing", Type="String")
+    template.add_parameter(existing)
+    first = Parameter("Duplicate", Type="String")
+    second = Parameter("Duplicate", Type="CommaDelimitedList")
+    add_parameters(template, [first, second, CfnParameter("Existing", Type="Number")])
+    assert template.parameters["Duplicate"] is first
+    assert template.parameters["Existing"] is existing
+    assert list(template.parameters) == ["Existing", "Duplicate"]
+
+
+def test_add_parameters_max_parameters():
+    template = Template()
+    add_parameters(
+        template,
+        [CfnParameter(f"Param{i}", Type="String") for i in range(MAX_PARAMETERS)],
+    )
+    assert len(template.parameters) == MAX_PARAMETERS
+    with raises(ValueError):
+        add_parameters(template, [CfnParameter("OneTooMany", Type="String")])
+    assert "OneTooMany" not in template.parameters
+
+
+def test_add_parameters_invalid_type():
+    template = Template()
+    with raises(TypeError):
+        add_parameters(
+            template, [CfnParameter("Valid", Type="String"), "NotAParameter"]
+        )
+    assert not template.parameters